@@ -1,4 +1,3 @@
-import functools
 import heapq
 
 __all__ = ['iterunion']
@@ -8,18 +7,24 @@ def iterunion(concepts, sortkey, next_concepts):
     heap = [(sortkey(c), c) for c in concepts]
     heapq.heapify(heap)
 
-    push = functools.partial(heapq.heappush, heap)
-    pop = functools.partial(heapq.heappop, heap)
+    push, pop = heapq.heappush, heapq.heappop
 
     seen = -1
 
+    # push every concept (reachable via several paths) only once
+    queued = {index for index, _ in heap}
+
     while heap:
-        index, concept = pop()
-        # requires sortkey to be an extension of the lattice order
+        index, concept = pop(heap)
+        # skips duplicates in the seed concepts (heapified as given)
+        # and, as neighbors are pushed only once, guards against a sortkey
+        # that is not an extension of the lattice order
         # (a toplogical sort of it) in the direction of next_concepts
-        # assert index >= seen
         if index > seen:
             seen = index
             yield concept
             for c in next_concepts(concept):
-                push((sortkey(c), c))
+                key = sortkey(c)
+                if key not in queued:
+                    queued.add(key)
+                    push(heap, (key, c))
@@ -6,6 +6,9 @@ Information Sciences 185.1 (2012): 114-127.
 https://doi.org/10.1016/j.ins.2011.09.023
 """
 
+import functools
+import operator
+
 __all__ = ['fast_generate_from', 'fcbo_dual']
 
 
@@ -42,16 +45,30 @@ def fast_generate_from(context):
 
     Properties = context._Properties
 
-    j_atom = list(enumerate(Properties.supremum.atoms()))
+    j_atom_mask = [(j, atom, atom - 1)
+                   for j, atom in enumerate(Properties.supremum.atoms())]
 
     Objects = context._Objects
 
-    prime = Objects.prime
+    extents = context._extents._ints
+    intents = context._intents._ints
+
+    supremum = int(Properties.supremum)
+
+    make_extent = Objects.fromint
+    make_intent = Properties.fromint
+
+    # top concept: all objects and the properties they all share
+    top_intent = functools.reduce(operator.and_, intents, supremum)
+    top = (Objects.supremum, make_intent(top_intent))
 
-    stack = [(Objects.supremum.doubleprime(), 0, [Properties.infimum] * n_properties)]
+    stack = [(top, 0, [Properties.infimum] * n_properties)]
+
+    push = stack.append
+    pop = stack.pop
 
     while stack:
-        concept, property_index, property_sets = stack.pop()
+        concept, property_index, property_sets = pop()
 
         yield concept
 
@@ -60,27 +77,35 @@ def fast_generate_from(context):
         if property_index == n_properties or not extent:
             continue
 
-        next_property_sets = property_sets.copy()
+        not_intent = supremum ^ intent  # subset tests: not x & not_intent
+
+        next_property_sets = property_sets  # copy on first write
 
-        for j, j_property in reversed(j_atom[property_index:]):
+        for j, j_property, j_mask in reversed(j_atom_mask[property_index:]):
             if j_property & intent:
                 continue
 
-            j_mask = j_property - 1
-
             x = next_property_sets[j] & j_mask
 
-            if x & intent == x:
-                j_extent = extent & context._extents[j]
+            if not x & not_intent:
+                j_extent = extent & extents[j]
 
-                j_intent = prime(j_extent)
+                # inlined Objects.prime(j_extent), unwrapped
+                j_intent = supremum
+                bitset = j_extent
+                while bitset:
+                    i = bitset.bit_length() - 1  # highest set bit
+                    j_intent &= intents[i]
+                    bitset ^= 1 << i
 
                 j_lower = j_intent & j_mask
 
-                if j_lower & intent == j_lower:
-                    concept = (Objects.fromint(j_extent), Properties.fromint(j_intent))
-                    stack.append((concept, j + 1, next_property_sets))
+                if not j_lower & not_intent:
+                    concept = (make_extent(j_extent), make_intent(j_intent))
+                    push((concept, j + 1, next_property_sets))
                 else:
+                    if next_property_sets is property_sets:
+                        next_property_sets = property_sets.copy()
                     next_property_sets[j] = j_intent
 
 
@@ -117,16 +142,30 @@ def fcbo_dual(context):
 
     Objects = context._Objects
 
-    j_atom = list(enumerate(Objects.supremum.atoms()))
+    j_atom_mask = [(j, atom, atom - 1)
+                   for j, atom in enumerate(Objects.supremum.atoms())]
 
     Properties = context._Properties
 
-    prime = Properties.prime
+    intents = context._intents._ints
+    extents = context._extents._ints
 
-    stack = [(Objects.infimum.doubleprime(), 0, [Objects.infimum] * n_objects)]
+    supremum = int(Objects.supremum)
+
+    make_extent = Objects.fromint
+    make_intent = Properties.fromint
+
+    # bottom concept: all properties and the objects having them all
+    bottom_extent = functools.reduce(operator.and_, extents, supremum)
+    bottom = (make_extent(bottom_extent), Properties.supremum)
+
+    stack = [(bottom, 0, [Objects.infimum] * n_objects)]
+
+    push = stack.append
+    pop = stack.pop
 
     while stack:
-        concept, object_index, object_sets = stack.pop()
+        concept, object_index, object_sets = pop()
 
         yield concept
 
@@ -135,25 +174,33 @@ def fcbo_dual(context):
         if object_index == n_objects or not intent:
             continue
 
-        next_object_sets = object_sets.copy()
+        not_extent = supremum ^ extent  # subset tests: not x & not_extent
+
+        next_object_sets = object_sets  # copy on first write
 
-        for j, j_object in reversed(j_atom[object_index:]):
+        for j, j_object, j_mask in reversed(j_atom_mask[object_index:]):
             if extent & j_object:
                 continue
 
-            j_mask = j_object - 1
-
             x = next_object_sets[j] & j_mask
 
-            if x & extent == x:
-                j_intent = intent & context._intents[j]
+            if not x & not_extent:
+                j_intent = intent & intents[j]
 
-                j_extent = prime(j_intent)
+                # inlined Properties.prime(j_intent), unwrapped
+                j_extent = supremum
+                bitset = j_intent
+                while bitset:
+                    i = bitset.bit_length() - 1  # highest set bit
+                    j_extent &= extents[i]
+                    bitset ^= 1 << i
 
                 j_lower = j_extent & j_mask
 
-                if j_lower & extent == j_lower:
-                    concept = (Objects.fromint(j_extent), Properties.fromint(j_intent))
-                    stack.append((concept, j + 1, next_object_sets))
+                if not j_lower & not_extent:
+                    concept = (make_extent(j_extent), make_intent(j_intent))
+                    push((concept, j + 1, next_object_sets))
                 else:
+                    if next_object_sets is object_sets:
+                        next_object_sets = object_sets.copy()
                     next_object_sets[j] = j_extent
@@ -8,54 +8,97 @@ Shaker Verlag, Aachen, Germany, 2000.
 http://citeseerx.ist.psu.edu/viewdoc/summary?doi=10.1.1.143.948
 """
 
-import functools
-import heapq
-
 __all__ = ['lattice', 'neighbors']
 
 
 def lattice(Objects, *, infimum):
     """Yield ``(extent, intent, upper, lower)`` in short lexicographic order."""
+    return _lattice(Objects, _atom_intents(Objects), infimum=infimum)
+
+
+def _lattice(Objects, atoms, *, infimum):
+    """Yield lattice() output, deriving neighbors from ``(atom, intent)`` pairs."""
     extent, intent = Objects.frommembers(infimum).doubleprime()
 
     concept = (extent, intent, [], [])
 
     mapping = {extent: concept}
 
-    heap = [(extent.shortlex(), concept)]
+    # candidate intents are closed, so this holds at most one item per concept
+    extents = {}
+
+    # bucket queue by extent cardinality: upper neighbors have strictly
+    # bigger extents, so each bucket is complete when it is reached
+    buckets = [[] for _ in range(len(Objects._members) + 1)]
+    buckets[extent.count()].append(concept)
+
+    for bucket in buckets:
+        bucket.sort(key=_shortlex)
+
+        for concept in bucket:
+            extent, _, upper, _ = concept
+
+            for n_extent, n_intent in _neighbors(extent, Objects, atoms,
+                                                 extents=extents):
+                upper.append(n_extent)
 
-    push = functools.partial(heapq.heappush, heap)
-    pop = functools.partial(heapq.heappop, heap)
+                neighbor = mapping.get(n_extent)
+                if neighbor is not None:
+                    neighbor[3].append(extent)
+                else:
+                    mapping[n_extent] = neighbor = (n_extent, n_intent, [], [extent])
+                    buckets[n_extent.count()].append(neighbor)
 
-    while heap:
-        _, concept = pop()
+            yield concept  # concept[3] keeps growing until exhaustion
 
-        extent, _, upper, _ = concept
 
-        for n_extent, n_intent in neighbors(extent, Objects=Objects):
-            upper.append(n_extent)
+def _shortlex(concept):
+    return concept[0].shortlex()
 
-            if n_extent in mapping:
-                mapping[n_extent][3].append(extent)
-            else:
-                mapping[n_extent] = neighbor = (n_extent, n_intent, [], [extent])
-                push((n_extent.shortlex(), neighbor))
 
-        yield concept  # concept[3] keeps growing until exhaustion
+def _atom_intents(Objects):
+    """Return ``(atom, intent)`` pairs for all singleton extents."""
+    prime = Objects.prime
+    return [(atom, prime(atom)) for atom in Objects.supremum.atoms()]
 
 
 def neighbors(objects, *, Objects):
     """Yield upper neighbors from extent (in colex order?)."""
-    doubleprime = Objects.doubleprime
+    return _neighbors(objects, Objects, _atom_intents(Objects))
 
-    minimal = ~objects
 
-    for add in Objects.atomic(minimal):
-        objects_and_add = objects | add
+def _neighbors(objects, Objects, atoms, *, extents=None):
+    """Yield neighbors() output, optionally caching closures in ``extents``."""
+    prime = Objects.prime
 
-        extent, intent = doubleprime(objects_and_add)
+    # derive all candidate intents from the intent of objects:
+    # (objects | add)' == objects' & add'
+    objects_intent = prime(objects)
 
-        if extent & ~objects_and_add & minimal:
-            minimal &= ~add
+    Properties = type(objects_intent)
+
+    closure = Properties.prime
+    make_intent = Properties.fromint
+
+    minimal = int(Objects.supremum) ^ objects  # ~objects without going negative
+
+    for add, add_intent in atoms:
+        if add & objects:
+            continue
+
+        intent = objects_intent & add_intent
+
+        if extents is None:
+            extent = closure(intent)
+        else:
+            try:
+                extent = extents[intent]
+            except KeyError:
+                extent = extents[intent] = closure(intent)
+
+        # extent & ~(objects | add) & minimal, as minimal excludes objects
+        # and add is in both extent and minimal
+        if extent & minimal != add:
+            minimal ^= add  # each add is removed at most once
         else:
-            yield extent, intent
+            yield extent, make_intent(intent)
@@ -143,18 +143,20 @@ class Data:
         if lattice is not None and not lattice:
             raise ValueError('empty lattice')
 
-        indexes = tuple(range(len(properties)))
+        indexes = range(len(properties))
 
-        def _make_set(r, indexes=set(indexes)):
+        def _make_bools(r, indexes=set(indexes), n_properties=len(properties)):
             result = set(r)
             if len(result) != len(r):
                 raise ValueError('context contains duplicated values')
             if not result.issubset(indexes):
                 raise ValueError('context contains invalid index')
-            return result
+            bools = [False] * n_properties
+            for i in result:  # set only the present ones
+                bools[i] = True
+            return tuple(bools)
 
-        bools = [tuple(i in intent for i in indexes)
-                 for intent in map(_make_set, context)]
+        bools = list(map(_make_bools, context))
 
         inst = cls(objects, properties, bools)
         assert 'lattice' not in inst.__dict__
@@ -196,8 +198,9 @@ class Data:
             common = set(objects) & set(properties)
             raise ValueError(f'objects and properties overlap: {common!r}')
 
+        n_properties = len(properties)
         if (len(bools) != len(objects)
-            or {len(b) for b in bools} != {len(properties)}):
+            or any(len(b) != n_properties for b in bools)):
             raise ValueError(f'bools is not {len(objects)} items'
                              f' of length {len(properties)}')
 
@@ -208,10 +211,12 @@ class Data:
         self._Objects = self._extents.BitSet
 
     def copy(self, include_lattice: typing.Optional[bool] = False):
-        """Return a fresh copy of the context (omits lattice)."""
+        """Return a fresh copy of the context (omits lattice, shares relation)."""
         if include_lattice:  # pragma: no cover
             raise NotImplementedError(f'.copy(include_lattice={include_lattice!r})')
-        return Context(self.objects, self.properties, self.bools)
+        inst = Context.__new__(Context)
+        inst.__setstate__(self.__getstate__())
+        return inst
 
     def __getstate__(self) -> typing.Tuple[typing.Tuple[str, ...],
                                            typing.Tuple[str, ...]]:
@@ -308,7 +313,17 @@ class FormattingMixin:
             >>> context.crc32()
             'b9d20179'
         """
-        return tools.crc32_hex(self.tostring().encode(encoding))
+        try:
+            return self._crc32s[encoding]
+        except KeyError:
+            result = tools.crc32_hex(self.tostring().encode(encoding))
+            self._crc32s[encoding] = result
+            return result
+
+    @tools.lazyproperty
+    def _crc32s(self) -> typing.Dict[str, str]:
+        """Memoized :meth:`crc32` results by encoding (contexts are immutable)."""
+        return {}
 
 
 class ComparableMixin:
@@ -334,9 +349,13 @@ class ComparableMixin:
         if not isinstance(other, Context):
             return NotImplemented
 
+        if self is other:
+            return True
+
+        # same objects and properties: compare packed rows instead of bools
         return (self.objects == other.objects
                 and self.properties == other.properties
-                and self.bools == other.bools)
+                and self._intents._ints == other._intents._ints)
 
     def __ne__(self, other: 'Context') -> typing.Union[bool, type(NotImplemented)]:
         """Return whether two contexts are inequivalent.
@@ -471,14 +490,21 @@ class LatticeMixin:
 
         cf. C. Lindig. 2000. Fast Concept Analysis.
         """
-        return algorithms.lattice(self._Objects, infimum=infimum)
+        return algorithms.lindig._lattice(self._Objects, self._atom_intents,
+                                          infimum=infimum)
 
     def _neighbors(self, objects):
         """Yield upper neighbors from extent (in colex order?).
 
         cf. C. Lindig. 2000. Fast Concept Analysis.
         """
-        return algorithms.neighbors(objects, Objects=self._Objects)
+        return algorithms.lindig._neighbors(objects, self._Objects,
+                                           self._atom_intents)
+
+    @tools.lazyproperty
+    def _atom_intents(self):
+        """``(atom, intent)`` pairs of all singleton extents (object rows)."""
+        return list(zip(self._Objects.supremum.atoms(), self._intents))
 
     def neighbors(self, objects: typing.Iterable[str],
                   raw: bool = False) -> typing.List[typing.Tuple[typing.Tuple[str, ...],
@@ -55,8 +55,8 @@ def read_concepts_dat(path, encoding=Fimi.encoding, newline=Fimi.newline):
 def write_concepts_dat(path, iterconcepts, *, extents: bool = False,
                        encoding=Fimi.encoding,
                        newline=Fimi.newline):
-    rows = ((list(extent.iter_set()) for extent, _ in iterconcepts) if extents
-            else (list(intent.iter_set()) for _, intent in iterconcepts))
+    rows = ((extent.iter_set() for extent, _ in iterconcepts) if extents
+            else (intent.iter_set() for _, intent in iterconcepts))
 
     with open(path, 'w', encoding=encoding, newline=newline) as f:
         tools.write_csv_file(f, rows, dialect=Fimi.dialect)
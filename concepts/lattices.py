@@ -66,14 +66,15 @@ class Data:
                     for args in context._lattice(infimum)]
         mapping = self._make_mapping(concepts)
 
-        shortlex = self._shortlex
-        longlex = self._longlex
+        # compute each sort key once instead of once per neighbor relation
+        shortlex = {e: e.shortlex() for e in mapping}.__getitem__
+        longlex = {e: e.longlex() for e in mapping}.__getitem__
         for index, c in enumerate(concepts):
             c.index = index
-            upper = (mapping[u] for u in c.upper_neighbors)
-            lower = (mapping[l] for l in c.lower_neighbors)
-            c.upper_neighbors = tuple(sorted(upper, key=shortlex))
-            c.lower_neighbors = tuple(sorted(lower, key=longlex))
+            upper = sorted(c.upper_neighbors, key=shortlex)
+            lower = sorted(c.lower_neighbors, key=longlex)
+            c.upper_neighbors = tuple(mapping[u] for u in upper)
+            c.lower_neighbors = tuple(mapping[l] for l in lower)
 
         self._init(self, context, concepts, mapping=mapping)
 
@@ -457,6 +458,7 @@ class NavigateableMixin:
         extents = (c._extent for i, c in heap)
         target = self._context._Objects.reduce_or(extents)
         seen = -1
+        queued = {index for index, _ in heap}
         while heap:
             index, concept = pop(heap)
             if index > seen:
@@ -466,7 +468,9 @@ class NavigateableMixin:
                     if concept._extent == target:
                         return
                     for c in concept.upper_neighbors:
-                        push(heap, (c.index, c))
+                        if c.index not in queued:
+                            queued.add(c.index)
+                            push(heap, (c.index, c))
 
 
 class VisualizableMixin:
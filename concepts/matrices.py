@@ -1,20 +1,92 @@
 """Boolean matrices as collections of row and column vectors."""
 
+import functools
+import operator
+
 import bitsets
 
+from . import tools
+
 __all__ = ['Relation']
 
 
-Vector = bitsets.bases.MemberBits
-"""Single row or column of a boolean matrix as bit vector."""
+try:
+    popcount = int.bit_count
+except AttributeError:  # pragma: no cover
+    _POPCOUNTS = bytes(bin(i).count('1') for i in range(256))
+
+    def popcount(n: int) -> int:
+        """Return the number of one bits in the binary representation of n."""
+        octets = n.to_bytes((n.bit_length() + 7) // 8, 'little')
+        return sum(octets.translate(_POPCOUNTS))
+
+
+class Vector(bitsets.bases.MemberBits):
+    """Single row or column of a boolean matrix as bit vector."""
+
+    @classmethod
+    def frommembers(cls, members=()):
+        """Create a set from an iterable of members (duplicates allowed)."""
+        atoms = map(cls._map.__getitem__, members)
+        return cls.fromint(functools.reduce(operator.or_, atoms, 0))
+
+    def count(self, value=True):
+        """Returns the number of present/absent members."""
+        if value is True:
+            return popcount(self)
+        return super().count(value)
+
+    def iter_set(self):
+        """Yield the indexes of the present members (in ascending order)."""
+        bitset = self._int
+        while bitset:
+            lowest = bitset & -bitset
+            yield lowest.bit_length() - 1
+            bitset ^= lowest
+
+    def _reinverted(self, r):
+        """Return int with reversed and inverted bits (assuming bit length r)."""
+        return int(format(self._int, f'0{r}b')[::-1], 2) ^ ((1 << r) - 1)
+
+    def _indexes(self):
+        """Yield the indexes of the present members (peel bits if sparse)."""
+        if popcount(self) * 4 < self._len:
+            return self.iter_set()
+        return super()._indexes()
+
+    def shortlex(self):
+        """Return sort key for short lexicographical order."""
+        return popcount(self), self._reinverted(self._len)
+
+    def longlex(self):
+        """Return sort key for long lexicographical order."""
+        return -popcount(self), self._reinverted(self._len)
+
+    def shortcolex(self):
+        """Return sort key for short colexicographical order."""
+        return popcount(self), self._int
+
+    def longcolex(self):
+        """Return sort key for long colexicographical order."""
+        return -popcount(self), self._int
 
 
 class Vectors(bitsets.series.Tuple):
     """Paired collection of rows or columns of a boolean matrix relation.
 
-    Trailing zeros see https://stackoverflow.com/q/63917579/3456664
+    Derivations peel set bits from the top with int.bit_length().
     """
 
+    @tools.lazyproperty
+    def _ints(self):
+        """Packed plain ``int`` vectors (exact tuple of exact int)."""
+        return tuple(map(int, self))
+
+    def _transposed_ints(self):
+        """Return the plain ``int`` vectors of the transposed matrix."""
+        bits = (format(v, f'0{self.BitSet._len}b') for v in self)
+        return [int(''.join(column)[::-1], 2) for column in zip(*bits)][::-1]
+
     def _pair_with(self, relation, index, other):
         if hasattr(self, 'prime'):
             raise RuntimeError(f'{self!r} attempt _pair_with {other!r}')
@@ -22,8 +94,11 @@ class Vectors(bitsets.series.Tuple):
         self.relation = relation
         self.relation_index = index
 
-        Prime = other.BitSet.supremum  # noqa: N806
-        Double = self.BitSet.supremum  # noqa: N806
+        Prime = int(other.BitSet.supremum)  # noqa: N806
+        Double = int(self.BitSet.supremum)  # noqa: N806
+
+        other_rows = other._ints
+        self_rows = self._ints
 
         make_prime = other.BitSet.fromint
         make_double = self.BitSet.fromint
@@ -32,14 +107,10 @@ class Vectors(bitsets.series.Tuple):
             """FCA derivation operator (extent->intent, intent->extent)."""
             prime = Prime
 
-            i = 0
             while bitset:
-                shift = (bitset & -bitset).bit_length() - 1  # trailing zero(s)
-                if not shift:
-                    shift = 1
-                    prime &= other[i]
-                i += shift
-                bitset >>= shift
+                i = bitset.bit_length() - 1  # highest set bit
+                prime &= other_rows[i]
+                bitset ^= 1 << i
 
             return make_prime(prime)
 
@@ -47,25 +118,17 @@ class Vectors(bitsets.series.Tuple):
             """FCA double derivation operator (extent->extent, intent->intent)."""
             prime = Prime
 
-            i = 0
             while bitset:
-                shift = (bitset & -bitset).bit_length() - 1
-                if not shift:
-                    shift = 1
-                    prime &= other[i]
-                i += shift
-                bitset >>= shift
+                i = bitset.bit_length() - 1
+                prime &= other_rows[i]
+                bitset ^= 1 << i
 
             double = Double
 
-            i = 0
             while prime:
-                shift = (prime & -prime).bit_length() - 1
-                if not shift:
-                    shift = 1
-                    double &= self[i]
-                i += shift
-                prime >>= shift
+                i = prime.bit_length() - 1
+                double &= self_rows[i]
+                prime ^= 1 << i
 
             return make_double(double)
 
@@ -73,26 +136,18 @@ class Vectors(bitsets.series.Tuple):
             """FCA single and double derivation (extent->extent+intent, intent->intent+extent)."""
             prime = Prime
 
-            i = 0
             while bitset:
-                shift = (bitset & -bitset).bit_length() - 1
-                if not shift:
-                    shift = 1
-                    prime &= other[i]
-                i += shift
-                bitset >>= shift
+                i = bitset.bit_length() - 1
+                prime &= other_rows[i]
+                bitset ^= 1 << i
 
             bitset = prime
             double = Double
 
-            i = 0
             while bitset:
-                shift = (bitset & -bitset).bit_length() - 1
-                if not shift:
-                    shift = 1
-                    double &= self[i]
-                i += shift
-                bitset >>= shift
+                i = bitset.bit_length() - 1
+                double &= self_rows[i]
+                bitset ^= 1 << i
 
             return make_double(double), make_prime(prime)
 
@@ -130,7 +185,7 @@ class Relation(tuple):
             Y = bitsets.bitset(yname, ymembers, Vector, tuple=Vectors)  # noqa: N806
 
         x = X.Tuple.frombools(xbools)
-        y = Y.Tuple.frombools(zip(*x.bools()))
+        y = Y.Tuple.fromints(x._transposed_ints())
 
         self = super().__new__(cls, (x, y))
 
@@ -59,6 +59,10 @@ def test_lattice(lattice):
                      '001111 <-> 0100000000',
                      '111111 <-> 0000000000']
 
+    result = algorithms.lattice(lattice._context._Objects, infimum=())
+
+    assert [f'{e.bits()} <-> {i.bits()}' for e, i, _, _ in result] == pairs
+
 
 @pytest.mark.parametrize('dual, expected', [
     (False, ['111111 <-> 0000000000',
@@ -117,6 +121,21 @@ def test_fcbo(context, dual, expected):
     assert pairs == expected
 
 
+def test_neighbors(context):
+    objects = context._Objects.frommembers(['1sg', '1pl'])
+
+    expected = [(('1sg', '1pl', '2sg', '2pl'), ('-3',)),
+                (('1sg', '1pl', '3sg', '3pl'), ('-2',))]
+
+    result = algorithms.neighbors(objects, Objects=context._Objects)
+
+    assert [(e.members(), i.members()) for e, i in result] == expected
+
+    result = context._neighbors(objects)
+
+    assert [(e.members(), i.members()) for e, i in result] == expected
+
+
 def test_serialize_bob_ross(test_output, bob_ross):
     target = test_output / f'{BOB_ROSS.stem}-serialized.py'
     bob_ross.tofile(str(target), frmat='python-literal')
@@ -68,6 +68,7 @@ def test_copy(context):
 
     assert copy == context
     assert 'lattice' not in copy.__dict__
+    assert copy._intents is context._intents
 
 
 def test_eq_noncontext(context):
@@ -80,6 +81,10 @@ def test_eq_true(context):
                                        context.bools)
 
 
+def test_eq_identity(context):
+    assert context == context
+
+
 def test_eq_false(context):
     d = context.definition()
     d.move_object('3pl', 0)
@@ -104,6 +109,7 @@ def test_ne_false(context):
 
 def test_crc32(context):
     assert context.crc32() == 'b9d20179' == context.definition().crc32()
+    assert context.crc32() is context.crc32()
 
 
 def test_minimize_infimum(context):
@@ -1,3 +1,4 @@
+import bitsets
 import pytest
 
 from concepts import matrices
@@ -13,6 +14,16 @@ def relation():
     return matrices.Relation(xname, yname, xmembers, ymembers, xbools)
 
 
+@pytest.fixture(scope='module')
+def wide_relation():
+    xmembers = tuple(f'x{i}' for i in range(70))
+    ymembers = 'a', 'b', 'c'
+    xbools = [tuple(i % 3 == 0 for i in range(70)),
+              tuple(i in (5, 66) for i in range(70)),
+              tuple(i == 69 for i in range(70))]
+    return matrices.Relation('Wide', 'Narrow', xmembers, ymembers, xbools)
+
+
 def test_pair_with(relation):
     vx, vy = relation
     with pytest.raises(RuntimeError, match=r'attempt _pair_with'):
@@ -24,3 +35,105 @@ def test_prime_infimum(relation):
 
     assert vx.prime(0) == vy.BitSet.supremum
     assert vy.prime(0) == vx.BitSet.supremum
+
+
+@pytest.mark.parametrize('bits, value, expected', [
+    ('0000', True, 0),
+    ('1011', True, 3),
+    ('1011', False, 1),
+])
+def test_vector_count(relation, bits, value, expected):
+    vx, _ = relation
+    vector = vx.BitSet.frombits(bits)
+
+    assert vector.count(value) == expected
+
+
+@pytest.mark.parametrize('method', ['shortlex', 'longlex', 'shortcolex', 'longcolex'])
+@pytest.mark.parametrize('bits', ['0000', '1000', '0110', '1011', '1111'])
+def test_vector_sortkey(relation, method, bits):
+    vx, _ = relation
+    vector = vx.BitSet.frombits(bits)
+    base_method = getattr(bitsets.bases.MemberBits, method)
+
+    assert getattr(vector, method)() == base_method(vector)
+
+
+@pytest.mark.parametrize('wide, value', [
+    (False, 0b0000),
+    (False, 0b0001),
+    (False, 0b0110),
+    (False, 0b1101),
+    (False, 0b1111),
+    (True, 0),
+    (True, 1),
+    (True, 1 << 69),
+    (True, 1 << 63 | 1 << 64),
+    (True, 0x2a5a5a5a5a5a5a5a5),
+    (True, (1 << 70) - 1),
+])
+def test_vector_reinverted(relation, wide_relation, wide, value):
+    vx, _ = wide_relation if wide else relation
+    vector = vx.BitSet.fromint(value)
+
+    expected = bitsets.integers.reinverted(value, vector._len)
+
+    assert vector._reinverted(vector._len) == expected
+
+
+@pytest.mark.parametrize('bits, expected', [
+    ('0000', []),
+    ('1000', [0]),
+    ('0110', [1, 2]),
+    ('1011', [0, 2, 3]),
+])
+def test_vector_iter_set(relation, bits, expected):
+    vx, _ = relation
+    vector = vx.BitSet.frombits(bits)
+
+    assert list(vector.iter_set()) == expected
+
+
+@pytest.mark.parametrize('wide', [False, True])
+def test_vectors_transposed_ints(relation, wide_relation, wide):
+    vx, vy = wide_relation if wide else relation
+
+    expected = [int(vy.BitSet.frombools(column)) for column in zip(*vx.bools())]
+
+    assert vx._transposed_ints() == expected
+    assert vy._transposed_ints() == vx.ints()
+
+
+@pytest.mark.parametrize('members, expected', [
+    ([], '0000'),
+    (['TF'], '0100'),
+    (['FF', 'TT', 'FF'], '1001'),
+])
+def test_vector_frommembers(relation, members, expected):
+    vx, _ = relation
+
+    assert vx.BitSet.frommembers(members).bits() == expected
+
+
+@pytest.mark.parametrize('bits', ['0000', '1000', '0110', '1011', '1111'])
+def test_vector_members(relation, bits):
+    vx, _ = relation
+    vector = vx.BitSet.frombits(bits)
+
+    assert vector.members() == bitsets.bases.MemberBits.members(vector)
+
+
+@pytest.mark.parametrize('indexes, expected', [
+    ([0], ('x0',)),
+    ([69], ('x69',)),
+    ([5, 66], ('x5', 'x66')),
+    ([3, 63, 64], ('x3', 'x63', 'x64')),
+])
+def test_sparse_vector_members(wide_relation, indexes, expected):
+    vx, _ = wide_relation
+    vector = vx.BitSet.fromint(sum(1 << i for i in indexes))
+
+    assert vector.count() * 4 < vector._len  # peeling path
+
+    assert vector.members() == expected
+    assert vector.members() == bitsets.bases.MemberBits.members(vector)